@@ -15,15 +15,19 @@ release = '0.1.0'
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.viewcode',
+    'autoapi.extension',
     'sphinx.ext.napoleon',
     'sphinx.ext.intersphinx',
 ]
 
-import os
-import sys
-sys.path.insert(0, os.path.abspath('../../src'))
+# AutoAPI parses the source instead of importing it; api.rst places the
+# documented objects itself via the autoapi* directives.
+autoapi_dirs = ['../src']
+autoapi_generate_api_docs = False
+
+# Render "Attributes:" docstring sections as field lists so they do not clash
+# with the dataclass fields AutoAPI documents as members.
+napoleon_use_ivar = True
 
 html_theme = 'furo'
 html_theme_options = {
@@ -40,7 +40,7 @@ Note:
 
 import re
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any
 
 
@@ -55,7 +55,7 @@ def _resolve_column_with_alias(column: str, table: str | None, table_aliases: di
         return column
 
 
-class JoinType(Enum):
+class JoinType(StrEnum):
     """SQL join types for table relationships.
 
     Defines the different ways tables can be joined in SQL queries, determining
@@ -91,7 +91,7 @@ class JoinType(Enum):
     FULL = "FULL OUTER JOIN"
 
 
-class AggFunction(Enum):
+class AggFunction(StrEnum):
     """Common SQL aggregate functions for use in SELECT clauses.
 
     Supported functions:
@@ -163,6 +163,16 @@ class AggFunction(Enum):
     COUNT_DISTINCT = "COUNT(DISTINCT"
 
 
+_AGG_TEMPLATES: dict[AggFunction, str] = {
+    AggFunction.COUNT: "COUNT({})",
+    AggFunction.SUM: "SUM({})",
+    AggFunction.AVG: "AVG({})",
+    AggFunction.MIN: "MIN({})",
+    AggFunction.MAX: "MAX({})",
+    AggFunction.COUNT_DISTINCT: "COUNT(DISTINCT {})",
+}
+
+
 class Operator(Enum):
     """SQL comparison operators for WHERE clauses.
 
@@ -234,7 +244,7 @@ class Operator(Enum):
     BETWEEN = "BETWEEN"
 
 
-@dataclass
+@dataclass(slots=True)
 class TableJoinAttribute:
     """Defines how to join from a source table to a target table.
 
@@ -269,7 +279,7 @@ class TableJoinAttribute:
         return self.table_name or join_key
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Represents a database table and its relationships to other tables.
 
@@ -298,7 +308,7 @@ class Table:
     joins: dict[str, TableJoinAttribute] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectColumn:
     """Represents a column in a SELECT clause with optional aggregation and aliasing.
 
@@ -345,10 +355,7 @@ class SelectColumn:
             sql_column = _resolve_column_with_alias(self.column, self.table, table_aliases)
 
         if self.agg_function:
-            if self.agg_function == AggFunction.COUNT_DISTINCT:
-                sql_expr = f"COUNT(DISTINCT {sql_column})"
-            else:
-                sql_expr = f"{self.agg_function.value}({sql_column})"
+            sql_expr = _AGG_TEMPLATES[self.agg_function].format(sql_column)
         elif self.distinct:
             sql_expr = f"DISTINCT {sql_column}"
         else:
@@ -359,7 +366,7 @@ class SelectColumn:
         return sql_expr
 
 
-@dataclass
+@dataclass(slots=True)
 class ViaStep:
     """Represents a single step in a multi-table join chain (via path).
 
@@ -396,7 +403,7 @@ class ViaStep:
     join_type: JoinType = JoinType.INNER
 
 
-@dataclass
+@dataclass(slots=True)
 class Join:
     """Specifies a join operation with optional via chain.
 
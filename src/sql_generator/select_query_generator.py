@@ -1,4 +1,5 @@
 import re
+from collections import Counter
 from typing import Any
 
 from sql_generator.QueryObjects import GroupBy, Join, JoinType, Operator, OrderBy, SelectColumn, Table, WhereCondition
@@ -20,6 +21,12 @@ _operator_map = {
 }
 
 
+# Known "<join type> <table>" prefixes, longest first so "full outer join " wins over shorter ones
+_join_prefixes = tuple(
+    sorted(((join_type.value.lower() + " ", join_type.value) for join_type in JoinType), key=lambda p: -len(p[0]))
+)
+
+
 class QueryBuilder:
     """SQL query builder using constructor-based API.
 
@@ -142,6 +149,9 @@ class QueryBuilder:
     Note:
         - Table aliases are auto-generated (first 3+ characters) with conflict resolution
         - All string inputs are normalized to objects during initialization
+        - The SQL is assembled during initialization; build() returns the cached result
+        - Changing select, joins, where, group_by, order_by, limit or tables after construction
+          has no effect on build(); create a new QueryBuilder instead
         - First table in tables list becomes the FROM clause
         - JOIN deduplication removes exact duplicate JOIN strings while preserving order
 
@@ -169,15 +179,22 @@ class QueryBuilder:
             limit: Optional maximum number of rows to return.
 
         Raises:
-            ValueError: If duplicate table names, invalid limit, or invalid WHERE format.
+            ValueError: If no tables, duplicate table names, invalid limit, or invalid WHERE format.
+                Because the query is assembled here, also if a SELECT, WHERE, GROUP BY or ORDER BY
+                column references an unknown table, a join key is not defined on its table, a join
+                target or via table is not in the tables list, or a via step has no join linking it
+                to the previous table.
 
         """
+        if not tables:
+            raise ValueError("At least one table is required")
         self._validate_unique_table_names(tables)
         if limit is not None and limit <= 0:
             raise ValueError("Limit must be a positive integer greater than 0")
 
         self.select = self._normalize_select(select)
-        self.tables = {table.name: table for table in tables}
+        self._tables_tuple = tuple(tables)
+        self.tables = {table.name: table for table in self._tables_tuple}
         self.joins = self._normalize_joins(joins or [])
         self.where = self._normalize_where(where or [])
         self.group_by = self._normalize_group_by(group_by or [])
@@ -185,7 +202,16 @@ class QueryBuilder:
         self.limit = limit
 
         self._table_aliases = {}
-        self._generate_table_aliases(tables)
+        self._generate_table_aliases()
+        # Filled lazily by via chains; direct joins never need it
+        self._reverse_joins = {}
+        self._primary_table = self._tables_tuple[0]
+        self._primary_alias = self._table_aliases[self._primary_table.name]
+
+        # SELECT columns never change after construction, so resolve and validate them once
+        self._rendered_columns = [col.to_sql(self._table_aliases) for col in self.select]
+
+        self._cached_sql, self._cached_params = self._assemble()
 
     @staticmethod
     def _validate_unique_table_names(tables: list[Table]) -> None:
@@ -198,10 +224,12 @@ class QueryBuilder:
             ValueError: If duplicate table names are found
 
         """
-        table_names = [table.name for table in tables]
-        if len(table_names) != len(set(table_names)):
-            duplicates = [name for name in table_names if table_names.count(name) > 1]
-            raise ValueError(f"Duplicate table names found: {set(duplicates)}")
+        counts = Counter(table.name for table in tables)
+        if len(counts) == len(tables):
+            return
+
+        duplicates = {name for name, count in counts.items() if count > 1}
+        raise ValueError(f"Duplicate table names found: {duplicates}")
 
     @staticmethod
     def _parse_table_column(item: str) -> tuple[str | None, str]:
@@ -216,11 +244,10 @@ class QueryBuilder:
                 return table_name, item
             else:
                 return None, item
-        elif "." in item:
-            table_name, col_name = item.split(".", 1)
+        table_name, sep, col_name = item.partition(".")
+        if sep:
             return table_name, col_name
-        else:
-            return None, item
+        return None, item
 
     def _get_select_aliases(self) -> set[str]:
         """Extract aliases from SELECT columns"""
@@ -327,13 +354,13 @@ class QueryBuilder:
 
         return normalized
 
-    def _generate_table_aliases(self, tables: list[Table]):
+    def _generate_table_aliases(self):
         """Generate unique aliases for tables that don't have user-defined aliases"""
         aliases = {}
         used_aliases = set()
 
         # First pass: collect user-defined aliases
-        for table in tables:
+        for table in self._tables_tuple:
             if table.alias:
                 if table.alias in used_aliases:
                     raise ValueError(f"Duplicate alias '{table.alias}' found")
@@ -341,12 +368,14 @@ class QueryBuilder:
                 used_aliases.add(table.alias)
 
         # Second pass: generate aliases for tables without user-defined ones
-        for table in tables:
+        for table in self._tables_tuple:
             if not table.alias:
                 alias_length = 3
                 alias = table.name[:alias_length]
 
                 while alias in used_aliases:
+                    if alias_length >= len(table.name):
+                        raise ValueError(f"Unable to generate a unique alias for table '{table.name}'")
                     alias_length += 1
                     alias = table.name[:alias_length]
 
@@ -355,6 +384,14 @@ class QueryBuilder:
 
         self._table_aliases = aliases
 
+    @staticmethod
+    def _index_joins_by_target(table: Table) -> dict[str, str]:
+        """Map each target table name to the first join key on table that reaches it"""
+        index = {}
+        for key, join_def in (table.joins or {}).items():
+            index.setdefault(join_def.get_table_name(key), key)
+        return index
+
     @staticmethod
     def _parse_join_string(join_str: str) -> tuple[str, str]:
         """Parse join string to extract join type and table name
@@ -363,6 +400,11 @@ class QueryBuilder:
         - "orders" -> ("INNER JOIN", "orders")
         - "left join orders" -> ("LEFT JOIN", "orders")
         """
+        lowered = join_str.lower()
+        for prefix, join_type in _join_prefixes:
+            if lowered.startswith(prefix):
+                return join_type, join_str[len(prefix) :].lstrip()
+
         parts = join_str.rsplit(" ", 1)
 
         if len(parts) == 1:
@@ -376,35 +418,38 @@ class QueryBuilder:
     def _build_direct_join(self, primary_table: Table, join_key: str, join_type: str) -> str:
         """Build a direct JOIN clause (no via chains)"""
         # Look up join definition
-        if join_key not in primary_table.joins:
-            raise ValueError(f"Join '{join_key}' not found in table '{primary_table.name}' joins")
-
-        join_def = primary_table.joins[join_key]
+        try:
+            join_def = (primary_table.joins or {})[join_key]
+        except KeyError:
+            raise ValueError(f"Join '{join_key}' not found in table '{primary_table.name}' joins") from None
 
         # Get target table name and validate it exists
         target_table_name = join_def.get_table_name(join_key)
-        if target_table_name not in self._table_aliases:
-            raise ValueError(f"Target table '{target_table_name}' not found in tables list")
+        try:
+            target_alias = self._table_aliases[target_table_name]
+        except KeyError:
+            raise ValueError(f"Target table '{target_table_name}' not found in tables list") from None
 
-        # Get aliases
         primary_alias = self._table_aliases[primary_table.name]
-        target_alias = self._table_aliases[target_table_name]
-
-        # Build JOIN condition
-        join_condition = f"{primary_alias}.{join_def.source_column} = {target_alias}.{join_def.target_column}"
 
-        # Return complete JOIN clause
-        return f"{join_type} {target_table_name} {target_alias} ON {join_condition}"
+        # Build complete JOIN clause and condition in one pass
+        return (
+            f"{join_type} {target_table_name} {target_alias} "
+            f"ON {primary_alias}.{join_def.source_column} = {target_alias}.{join_def.target_column}"
+        )
 
     def _build_via_join_with_steps(self, primary_table: Table, join_obj: Join) -> list[str]:
         """Build JOIN clauses using ViaStep objects with custom join types"""
 
         def _find_join_to_table(from_table: Table, to_table_name: str) -> str:
             """Find join key from from_table to to_table_name"""
-            for key, join_def in from_table.joins.items():
-                if join_def.get_table_name(key) == to_table_name:
-                    return key
-            raise ValueError(f"No join found from '{from_table.name}' to '{to_table_name}'")
+            index = self._reverse_joins.get(from_table.name)
+            if index is None:
+                index = self._reverse_joins[from_table.name] = self._index_joins_by_target(from_table)
+            try:
+                return index[to_table_name]
+            except KeyError:
+                raise ValueError(f"No join found from '{from_table.name}' to '{to_table_name}'") from None
 
         join_clauses = []
         current_table = primary_table
@@ -415,7 +460,7 @@ class QueryBuilder:
 
             via_join_key = _find_join_to_table(current_table, via_step.table_name)
 
-            join_clause = self._build_direct_join(current_table, via_join_key, via_step.join_type.value)
+            join_clause = self._build_direct_join(current_table, via_join_key, via_step.join_type)
             join_clauses.append(join_clause)
 
             # Move to next table in chain
@@ -426,14 +471,13 @@ class QueryBuilder:
     def _generate_join_clauses(self) -> list[str]:
         """Generate JOIN clauses - now only handles Join objects"""
         join_clauses = []
-        primary_table = list(self.tables.values())[0]
 
         for join_obj in self.joins:
             if join_obj.via_steps:
-                via_clauses = self._build_via_join_with_steps(primary_table, join_obj)
+                via_clauses = self._build_via_join_with_steps(self._primary_table, join_obj)
                 join_clauses.extend(via_clauses)
             else:
-                join_clause = self._build_direct_join(primary_table, join_obj.join_key, JoinType.INNER.value)
+                join_clause = self._build_direct_join(self._primary_table, join_obj.join_key, JoinType.INNER)
                 join_clauses.append(join_clause)
 
         return join_clauses
@@ -482,9 +526,11 @@ class QueryBuilder:
     def build(self) -> tuple[str, list]:
         """Generate SQL query string and parameters from QueryBuilder configuration.
 
-        Constructs a complete SQL SELECT statement using all components provided during
-        initialization. Automatically handles table aliasing, JOIN deduplication, and
-        parameterized queries for safe execution.
+        Returns the complete SQL SELECT statement assembled from all components provided
+        during initialization. Automatically handles table aliasing, JOIN deduplication, and
+        parameterized queries for safe execution. The query is assembled once when the
+        QueryBuilder is created, so repeated calls are cheap. Changing the builder's attributes
+        afterwards has no effect on the result; create a new QueryBuilder instead.
 
         Returns:
             tuple[str, list]: A tuple containing:
@@ -559,36 +605,35 @@ class QueryBuilder:
             - All clauses follow standard SQL order: SELECT, FROM, JOIN, WHERE, GROUP BY, ORDER BY, LIMIT
 
         """
-        select_sql = [col.to_sql(self._table_aliases) for col in self.select]
-        select_clause = f"SELECT {', '.join(select_sql)}"
-
-        primary_table = list(self.tables.values())[0]
-        primary_alias = self._table_aliases[primary_table.name]
-        from_clause = f"FROM {primary_table.name} {primary_alias}"
-
-        clauses = [select_clause, from_clause]
-        all_params = []
-
-        join_clauses = self._generate_join_clauses()
-        join_clauses = list(dict.fromkeys(join_clauses))
-        if join_clauses:
-            clauses.extend(join_clauses)
-
-        where_clause, where_params = self._generate_where_clauses()
+        return self._cached_sql, list(self._cached_params)
+
+    def _assemble(self) -> tuple[str, list]:
+        """Assemble the SQL query string and parameters from the normalized components"""
+        parts = [
+            "SELECT ",
+            ", ".join(self._rendered_columns),
+            "\nFROM ",
+            self._primary_table.name,
+            " ",
+            self._primary_alias,
+        ]
+
+        for join_clause in dict.fromkeys(self._generate_join_clauses()):
+            parts.extend(("\n", join_clause))
+
+        where_clause, all_params = self._generate_where_clauses()
         if where_clause:
-            clauses.append(f"WHERE {where_clause}")
-            all_params.extend(where_params)
+            parts.extend(("\nWHERE ", where_clause))
 
         group_by_clauses = self._process_group_by()
         if group_by_clauses:
-            clauses.append(f"GROUP BY {', '.join(group_by_clauses)}")
+            parts.extend(("\nGROUP BY ", ", ".join(group_by_clauses)))
 
         order_by_clauses = self._process_order_by()
         if order_by_clauses:
-            clauses.append(f"ORDER BY {', '.join(order_by_clauses)}")
+            parts.extend(("\nORDER BY ", ", ".join(order_by_clauses)))
 
         if self.limit:
-            clauses.append(f"LIMIT {self.limit}")
+            parts.extend(("\nLIMIT ", str(self.limit)))
 
-        sql = "\n".join(clauses)
-        return sql, all_params
+        return "".join(parts), all_params
@@ -7,10 +7,11 @@ from tests.utils import _normalize_sql
 
 class TestGroupBy(TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up fictional database tables for testing"""
-        self.users = Table("users", primary_key="id")
-        self.orders = Table("orders", primary_key="id")
+        cls.users = Table("users", primary_key="id")
+        cls.orders = Table("orders", primary_key="id")
 
     def test_group_by_string_without_table_prefix(self):
         """Test GROUP BY using string without table prefix"""
@@ -1,44 +1,29 @@
 from unittest import TestCase
 
-from sql_generator.QueryObjects import Join, JoinType, Table, TableJoinAttribute, ViaStep
+from sql_generator.QueryObjects import Join, JoinType, ViaStep
 from sql_generator.select_query_generator import QueryBuilder
-from tests.utils import _normalize_sql
+from tests.utils import (
+    _CATEGORIES,
+    _ORDER_ITEMS,
+    _ORDERS,
+    _PRODUCTS,
+    _PROFILES,
+    _USERS,
+    _normalize_sql,
+)
 
 
 class TestJoins(TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up fictional database tables for testing"""
-        self.users = Table("users", primary_key="id")
-        self.orders = Table("orders", primary_key="id")
-        self.products = Table("products", primary_key="id")
-        self.order_items = Table("order_items", primary_key="id")
-        self.categories = Table("categories", primary_key="id")
-        self.profiles = Table("profiles", primary_key="profile_id")
-
-        self.users.joins = {
-            "orders": TableJoinAttribute(self.users.primary_key, "user_id"),
-            "profiles": TableJoinAttribute(self.users.primary_key, "user_id"),
-        }
-
-        self.orders.joins = {
-            "order_items": TableJoinAttribute(self.orders.primary_key, "order_id"),
-            "users": TableJoinAttribute("user_id", self.users.primary_key),
-        }
-
-        self.products.joins = {
-            "order_items": TableJoinAttribute(self.products.primary_key, "product_id"),
-            "categories": TableJoinAttribute("category_id", self.categories.primary_key),
-        }
-
-        self.order_items.joins = {
-            "orders": TableJoinAttribute("order_id", self.orders.primary_key),
-            "products": TableJoinAttribute("product_id", self.products.primary_key),
-        }
-
-        self.categories.joins = {"products": TableJoinAttribute(self.categories.primary_key, "category_id")}
-
-        self.profiles.joins = {"users": TableJoinAttribute("user_id", self.users.primary_key)}
+        cls.users = _USERS
+        cls.orders = _ORDERS
+        cls.products = _PRODUCTS
+        cls.order_items = _ORDER_ITEMS
+        cls.categories = _CATEGORIES
+        cls.profiles = _PROFILES
 
     def test_simple_inner_join_string(self):
         """Test simple INNER JOIN using string join key"""
@@ -118,3 +103,43 @@ class TestJoins(TestCase):
         )
         self.assertEqual(_normalize_sql(sql), expected)
         self.assertEqual(params, [])
+
+    def test_join_via_chain_missing_step_raises_error(self):
+        """Test via chain step without a join definition raises error"""
+        with self.assertRaises(ValueError) as context:
+            QueryBuilder(
+                tables=[self.users, self.orders, self.categories],
+                select=["users.name"],
+                joins=[Join("categories", via_steps=[ViaStep("orders"), ViaStep("categories")])],
+            )
+
+        self.assertIn("No join found from 'orders' to 'categories'", str(context.exception))
+
+    def test_parse_join_string_prefixes(self):
+        """Test join strings are split into SQL join type and join key"""
+        test_cases = [
+            ("orders", ("INNER JOIN", "orders")),
+            ("left join orders", ("LEFT JOIN", "orders")),
+            ("LEFT JOIN orders", ("LEFT JOIN", "orders")),
+            ("left join  orders", ("LEFT JOIN", "orders")),
+            ("full outer join orders", ("FULL OUTER JOIN", "orders")),
+            ("cross join orders", ("CROSS JOIN", "orders")),
+        ]
+
+        for join_str, expected in test_cases:
+            with self.subTest(join_str=join_str):
+                self.assertEqual(QueryBuilder._parse_join_string(join_str), expected)
+
+    def test_join_key_not_defined_raises_error(self):
+        """Test joining on a key missing from the primary table joins raises error"""
+        with self.assertRaises(ValueError) as context:
+            QueryBuilder(tables=[self.users, self.categories], select=["users.name"], joins=["categories"])
+
+        self.assertIn("Join 'categories' not found in table 'users' joins", str(context.exception))
+
+    def test_join_target_table_missing_raises_error(self):
+        """Test joining to a table that is not in the tables list raises error"""
+        with self.assertRaises(ValueError) as context:
+            QueryBuilder(tables=[self.users], select=["users.name"], joins=["orders"])
+
+        self.assertIn("Target table 'orders' not found in tables list", str(context.exception))
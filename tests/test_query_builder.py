@@ -9,48 +9,32 @@ from sql_generator.QueryObjects import (
     OrderBy,
     SelectColumn,
     Table,
-    TableJoinAttribute,
     ViaStep,
     WhereCondition,
 )
 from sql_generator.select_query_generator import QueryBuilder
-from tests.utils import _normalize_sql
+from tests.utils import (
+    _CATEGORIES,
+    _ORDER_ITEMS,
+    _ORDERS,
+    _PRODUCTS,
+    _PROFILES,
+    _USERS,
+    _normalize_sql,
+)
 
 
 class TestQueryBuilderIntegration(TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up comprehensive fictional database for integration testing"""
-        self.users = Table("users", primary_key="id")
-        self.orders = Table("orders", primary_key="id")
-        self.products = Table("products", primary_key="id")
-        self.order_items = Table("order_items", primary_key="id")
-        self.categories = Table("categories", primary_key="id")
-        self.profiles = Table("profiles", primary_key="profile_id")
-
-        self.users.joins = {
-            "orders": TableJoinAttribute(self.users.primary_key, "user_id"),
-            "profiles": TableJoinAttribute(self.users.primary_key, "user_id"),
-        }
-
-        self.orders.joins = {
-            "order_items": TableJoinAttribute(self.orders.primary_key, "order_id"),
-            "users": TableJoinAttribute("user_id", self.users.primary_key),
-        }
-
-        self.products.joins = {
-            "order_items": TableJoinAttribute(self.products.primary_key, "product_id"),
-            "categories": TableJoinAttribute("category_id", self.categories.primary_key),
-        }
-
-        self.order_items.joins = {
-            "orders": TableJoinAttribute("order_id", self.orders.primary_key),
-            "products": TableJoinAttribute("product_id", self.products.primary_key),
-        }
-
-        self.categories.joins = {"products": TableJoinAttribute(self.categories.primary_key, "category_id")}
-
-        self.profiles.joins = {"users": TableJoinAttribute("user_id", self.users.primary_key)}
+        cls.users = _USERS
+        cls.orders = _ORDERS
+        cls.products = _PRODUCTS
+        cls.order_items = _ORDER_ITEMS
+        cls.categories = _CATEGORIES
+        cls.profiles = _PROFILES
 
     def test_comprehensive_query_with_all_features(self):
         """Test complex query using every QueryBuilder feature"""
@@ -144,3 +128,28 @@ class TestQueryBuilderIntegration(TestCase):
 
         self.assertEqual(_normalize_sql(sql), "SELECT * FROM users use")
         self.assertEqual(params, [])
+
+    def test_duplicate_table_names_raise_error(self):
+        """Test duplicate table names are reported once each"""
+        with self.assertRaises(ValueError) as context:
+            QueryBuilder(tables=[self.users, self.orders, Table("users"), Table("orders")], select=["*"])
+
+        self.assertIn("Duplicate table names found", str(context.exception))
+        self.assertIn("'users'", str(context.exception))
+        self.assertIn("'orders'", str(context.exception))
+
+    def test_empty_tables_raise_error(self):
+        """Test QueryBuilder requires at least one table"""
+        with self.assertRaises(ValueError) as context:
+            QueryBuilder(tables=[], select=["*"])
+
+        self.assertIn("At least one table is required", str(context.exception))
+
+    def test_repeated_build_returns_same_query(self):
+        """Test build() can be called repeatedly without params leaking between calls"""
+        qb = QueryBuilder(tables=[self.users], select=["users.name"], where={"users.age__gt": 18})
+
+        sql, params = qb.build()
+        params.append("mutated")
+
+        self.assertEqual(qb.build(), (sql, [18]))
@@ -1,5 +1,9 @@
 """Unit test for query generator module."""
 
+import pickle
+from copy import deepcopy
+from dataclasses import asdict, astuple
+from enum import StrEnum
 from unittest import TestCase
 
 from sql_generator.QueryObjects import (
@@ -31,20 +35,18 @@ class TestJoins(TestCase):
         join = TableJoinAttribute("id", "user_id", table_name="addresses")
         self.assertEqual(join.table_name, "addresses")
 
-    def test_get_table_name_with_default(self):
-        """Test get_table_name returns join_key when table_name is None"""
-        join = TableJoinAttribute("id", "user_id")
-        self.assertEqual(join.get_table_name("orders"), "orders")
-
-    def test_get_table_name_with_override(self):
-        """Test get_table_name returns table_name when specified"""
-        join = TableJoinAttribute("id", "user_id", table_name="addresses")
-        self.assertEqual(join.get_table_name("billing_address"), "addresses")
+    def test_get_table_name(self):
+        """Test get_table_name uses table_name when set and falls back to join_key otherwise"""
+        test_cases = [
+            (None, "orders", "orders"),
+            ("addresses", "billing_address", "addresses"),
+            ("", "orders", "orders"),
+        ]
 
-    def test_get_table_name_empty_string_table_name(self):
-        """Test get_table_name with empty string table_name falls back to join_key"""
-        join = TableJoinAttribute("id", "user_id", table_name="")
-        self.assertEqual(join.get_table_name("orders"), "orders")
+        for table_name, join_key, expected in test_cases:
+            with self.subTest(table_name=table_name, join_key=join_key):
+                join = TableJoinAttribute("id", "user_id", table_name=table_name)
+                self.assertEqual(join.get_table_name(join_key), expected)
 
 
 class TestJoinObjects(TestCase):
@@ -92,6 +94,12 @@ class TestJoinObjects(TestCase):
         self.assertEqual(step2.table_name, "profiles")
         self.assertEqual(step2.join_type, JoinType.LEFT)
 
+    def test_enum_members_are_strings(self):
+        """Test JoinType and AggFunction members can be used directly as SQL strings"""
+        self.assertEqual(JoinType.LEFT, "LEFT JOIN")
+        self.assertEqual(f"{JoinType.FULL} orders", "FULL OUTER JOIN orders")
+        self.assertEqual(AggFunction.SUM, "SUM")
+
 
 class TestTable(TestCase):
 
@@ -160,12 +168,67 @@ class TestTable(TestCase):
         self.assertIsNone(table.alias)
         self.assertIsNotNone(table.joins)
 
+    def test_table_joins_accept_str_enum_keys(self):
+        """Test Table.joins accepts str subclasses such as StrEnum members as keys"""
+
+        class TableName(StrEnum):
+            ORDERS = "orders"
+
+        table = Table("users", joins={TableName.ORDERS: TableJoinAttribute("id", "user_id")})
+        self.assertEqual(table.joins[TableName.ORDERS].source_column, "id")
+        self.assertIn("orders", table.joins)
+
+    def test_table_with_joins_can_be_copied(self):
+        """Test Table with joins supports deepcopy, pickle and equality"""
+        table = Table("users", joins={"orders": TableJoinAttribute("id", "user_id")})
+
+        for copied in (deepcopy(table), pickle.loads(pickle.dumps(table))):
+            with self.subTest(copied=copied):
+                self.assertEqual(copied, table)
+                self.assertIsNot(copied.joins, table.joins)
+
+    def test_table_with_joins_asdict(self):
+        """Test dataclasses.asdict converts a Table with joins"""
+        table = Table("users", joins={"orders": TableJoinAttribute("id", "user_id")})
+        self.assertEqual(
+            asdict(table),
+            {
+                "name": "users",
+                "primary_key": None,
+                "alias": None,
+                "joins": {"orders": {"source_column": "id", "target_column": "user_id", "table_name": None}},
+            },
+        )
+
+    def test_table_with_joins_asdict_result_is_mutable(self):
+        """Test dataclasses.asdict returns plain dicts that can be modified"""
+        table = Table("users", joins={"orders": TableJoinAttribute("id", "user_id")})
+        result = asdict(table)
+        self.assertIs(type(result["joins"]), dict)
+        result["joins"]["profiles"] = {"source_column": "id", "target_column": "user_id", "table_name": None}
+        self.assertEqual(list(result["joins"]), ["orders", "profiles"])
+        self.assertEqual(list(table.joins), ["orders"])
+
+    def test_table_with_joins_astuple(self):
+        """Test dataclasses.astuple converts a Table with joins"""
+        table = Table("users", joins={"orders": TableJoinAttribute("id", "user_id")})
+        self.assertEqual(astuple(table), ("users", None, None, {"orders": ("id", "user_id", None)}))
+
+    def test_table_and_join_attribute_use_slots(self):
+        """Test Table and TableJoinAttribute instances are slotted and reject unknown attributes"""
+        for obj in (Table("users"), TableJoinAttribute("id", "user_id")):
+            with self.subTest(cls=type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    obj.unknown = "value"
+
 
 class TestSelectColumn(TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.table_aliases = {"users": "u", "orders": "ord", "products": "pro"}
+        cls.table_aliases = {"users": "u", "orders": "ord", "products": "pro"}
 
     def test_simple_column_with_table(self):
         """Test basic column with table reference"""
@@ -250,6 +313,12 @@ class TestSelectColumn(TestCase):
         result = col.to_sql(self.table_aliases)
         self.assertEqual(result, "CURRENT_TIMESTAMP AS now")
 
+    def test_select_column_can_be_modified(self):
+        """Test SelectColumn attributes can be changed after construction"""
+        col = SelectColumn("name", table="users")
+        col.alias = "user_name"
+        self.assertEqual(col.to_sql(self.table_aliases), "u.name AS user_name")
+
 
 class TestViaStep(TestCase):
     """Test ViaStep dataclass"""
@@ -290,10 +359,11 @@ class TestJoin(TestCase):
 class TestGroupBy(TestCase):
     """Test GroupBy dataclass"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.table_aliases = {"users": "u", "orders": "ord"}
-        self.select_aliases = {"total_orders"}
+        cls.table_aliases = {"users": "u", "orders": "ord"}
+        cls.select_aliases = {"total_orders"}
 
     def test_group_by_with_table(self):
         """Test GroupBy with table reference"""
@@ -317,10 +387,11 @@ class TestGroupBy(TestCase):
 class TestOrderBy(TestCase):
     """Test OrderBy dataclass"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.table_aliases = {"users": "u", "orders": "ord"}
-        self.select_aliases = {"total_orders"}
+        cls.table_aliases = {"users": "u", "orders": "ord"}
+        cls.select_aliases = {"total_orders"}
 
     def test_order_by_default_direction(self):
         """Test OrderBy with default ASC direction"""
@@ -355,9 +426,10 @@ class TestOrderBy(TestCase):
 class TestWhereCondition(TestCase):
     """Test WhereCondition class thoroughly"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.table_aliases = {"users": "u", "orders": "ord", "products": "pro"}
+        cls.table_aliases = {"users": "u", "orders": "ord", "products": "pro"}
 
     def test_basic_equality_condition(self):
         """Test basic equality condition"""
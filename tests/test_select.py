@@ -7,11 +7,12 @@ from tests.utils import _normalize_sql
 
 class TestSelect(TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up fictional database tables for testing"""
-        self.users = Table("users", primary_key="id")
-        self.orders = Table("orders", primary_key="id")
-        self.profiles = Table("profiles", primary_key="profile_id")
+        cls.users = Table("users", primary_key="id")
+        cls.orders = Table("orders", primary_key="id")
+        cls.profiles = Table("profiles", primary_key="profile_id")
 
     def test_simple_select_all_single_table(self):
         """Test SELECT * FROM single table"""
@@ -144,6 +145,25 @@ class TestSelect(TestCase):
         self.assertEqual(_normalize_sql(sql), "SELECT ab.name FROM ab ab")
         self.assertEqual(params, [])
 
+    def test_select_alias_generation_shared_prefix(self):
+        """Test generated aliases grow past shared prefixes"""
+        qb = QueryBuilder(
+            tables=[Table("orders"), Table("order_items"), Table("order_notes")],
+            select=["orders.id", "order_items.id", "order_notes.id"],
+        )
+
+        sql, params = qb.build()
+
+        self.assertEqual(_normalize_sql(sql), "SELECT ord.id, orde.id, order.id FROM orders ord")
+        self.assertEqual(params, [])
+
+    def test_select_alias_generation_exhausted_prefixes(self):
+        """Test alias generation fails instead of looping when every prefix is taken"""
+        with self.assertRaises(ValueError) as context:
+            QueryBuilder(tables=[Table("users", alias="use"), Table("use")], select=["*"])
+
+        self.assertIn("Unable to generate a unique alias for table 'use'", str(context.exception))
+
     def test_select_column_with_aggregation(self):
         """Test SelectColumn with aggregate functions"""
         qb = QueryBuilder(
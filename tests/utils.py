@@ -1,3 +1,41 @@
+import re
+from functools import lru_cache
+
+from sql_generator.QueryObjects import Table, TableJoinAttribute
+
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
 def _normalize_sql(sql: str) -> str:
     """Remove extra whitespace and newlines for consistent testing"""
-    return " ".join(sql.split())
+    return _WS_RE.sub(" ", sql).strip()
+
+
+# Shared fictional schema, built once at import. Tests only read these tables; build a fresh
+# Table when a test needs to change one.
+_USERS = Table(
+    "users",
+    primary_key="id",
+    joins={"orders": TableJoinAttribute("id", "user_id"), "profiles": TableJoinAttribute("id", "user_id")},
+)
+_ORDERS = Table(
+    "orders",
+    primary_key="id",
+    joins={"order_items": TableJoinAttribute("id", "order_id"), "users": TableJoinAttribute("user_id", "id")},
+)
+_PRODUCTS = Table(
+    "products",
+    primary_key="id",
+    joins={
+        "order_items": TableJoinAttribute("id", "product_id"),
+        "categories": TableJoinAttribute("category_id", "id"),
+    },
+)
+_ORDER_ITEMS = Table(
+    "order_items",
+    primary_key="id",
+    joins={"orders": TableJoinAttribute("order_id", "id"), "products": TableJoinAttribute("product_id", "id")},
+)
+_CATEGORIES = Table("categories", primary_key="id", joins={"products": TableJoinAttribute("id", "category_id")})
+_PROFILES = Table("profiles", primary_key="profile_id", joins={"users": TableJoinAttribute("user_id", "id")})